@@ -0,0 +1,165 @@
+use npvrbe;
+
+drop temporary table if exists tmp_index_columns;
+
+create temporary table tmp_index_columns (
+	primary key (TABLE_SCHEMA, TABLE_NAME, INDEX_NAME)
+) as
+select
+	TABLE_SCHEMA,
+	TABLE_NAME,
+	INDEX_NAME,
+	if(char_length(COLS) > 256, concat(left(COLS, 253), '...'), COLS) as INDEXED_COLUMNS,
+	INDEX_TYPE,
+	NON_UNIQUE,
+	CARDINALITY
+from
+	(
+	select
+		TABLE_SCHEMA,
+		TABLE_NAME,
+		INDEX_NAME,
+		group_concat(COLUMN_NAME order by SEQ_IN_INDEX) as COLS,
+		max(INDEX_TYPE) as INDEX_TYPE,
+		max(NON_UNIQUE) as NON_UNIQUE,
+		max(CARDINALITY) as CARDINALITY
+	from
+		information_schema.STATISTICS
+	where
+		TABLE_SCHEMA = database()
+	group by
+		TABLE_SCHEMA,
+		TABLE_NAME,
+		INDEX_NAME
+) INDEXCOLS;
+
+-- the usage, unused-index and top 10 queries below join tmp_index_columns:
+-- run the drop/create above first in each session (re-running it refreshes
+-- the cached column lists); the size, foreign key and redundant index
+-- queries need no setup
+
+select
+	t.OBJECT_SCHEMA,
+	t.OBJECT_NAME,
+	t.INDEX_NAME,
+	s.INDEXED_COLUMNS,
+	s.INDEX_TYPE,
+	s.NON_UNIQUE,
+	s.CARDINALITY,
+	t.COUNT_STAR,
+	t.COUNT_READ,
+	t.COUNT_WRITE,
+	t.COUNT_FETCH,
+	t.COUNT_INSERT,
+	t.COUNT_UPDATE,
+	t.COUNT_DELETE
+from
+	performance_schema.table_io_waits_summary_by_index_usage t
+left join tmp_index_columns s
+on
+	s.TABLE_SCHEMA = t.OBJECT_SCHEMA
+	and s.TABLE_NAME = t.OBJECT_NAME
+	and s.INDEX_NAME = t.INDEX_NAME
+where
+	t.OBJECT_SCHEMA = database()
+	and t.INDEX_NAME is not null
+order by
+	t.COUNT_STAR,
+	t.OBJECT_SCHEMA,
+	t.OBJECT_NAME,
+	t.INDEX_NAME;
+
+select
+	t.OBJECT_SCHEMA,
+	t.OBJECT_NAME,
+	t.INDEX_NAME,
+	s.INDEXED_COLUMNS,
+	s.NON_UNIQUE
+from
+	performance_schema.table_io_waits_summary_by_index_usage t
+left join tmp_index_columns s
+on
+	s.TABLE_SCHEMA = t.OBJECT_SCHEMA
+	and s.TABLE_NAME = t.OBJECT_NAME
+	and s.INDEX_NAME = t.INDEX_NAME
+where
+	t.OBJECT_SCHEMA = database()
+	and t.INDEX_NAME is not null
+	and t.INDEX_NAME <> 'PRIMARY'
+	and t.COUNT_STAR = 0
+order by
+	t.OBJECT_SCHEMA,
+	t.OBJECT_NAME,
+	t.INDEX_NAME;
+
+select
+	t.OBJECT_SCHEMA,
+	t.OBJECT_NAME,
+	t.INDEX_NAME,
+	s.INDEXED_COLUMNS,
+	t.COUNT_STAR,
+	t.COUNT_READ,
+	t.COUNT_WRITE
+from
+	performance_schema.table_io_waits_summary_by_index_usage t
+left join tmp_index_columns s
+on
+	s.TABLE_SCHEMA = t.OBJECT_SCHEMA
+	and s.TABLE_NAME = t.OBJECT_NAME
+	and s.INDEX_NAME = t.INDEX_NAME
+where
+	t.OBJECT_SCHEMA = database()
+	and t.INDEX_NAME is not null
+	and t.COUNT_STAR > 0
+order by
+	t.COUNT_STAR desc,
+	t.OBJECT_SCHEMA,
+	t.OBJECT_NAME,
+	t.INDEX_NAME
+limit 10;
+
+select
+	database() as TABLE_SCHEMA,
+	coalesce(TABLE_NAME, '(schema total)') as TABLE_NAME,
+	DATA_MB,
+	INDEX_MB,
+	TOTAL_MB
+from
+	(
+	select
+		TABLE_NAME,
+		round(sum(DATA_LENGTH) / 1024 / 1024, 2) as DATA_MB,
+		round(sum(INDEX_LENGTH) / 1024 / 1024, 2) as INDEX_MB,
+		round(sum(DATA_LENGTH + INDEX_LENGTH) / 1024 / 1024, 2) as TOTAL_MB
+	from
+		information_schema.TABLES
+	where
+		TABLE_SCHEMA = database()
+		and TABLE_TYPE = 'BASE TABLE'
+	group by
+		TABLE_NAME with rollup
+) SIZES
+order by
+	TOTAL_MB desc,
+	TABLE_NAME;
+
+select
+	TABLE_SCHEMA,
+	TABLE_NAME,
+	CONSTRAINT_NAME,
+	COLUMN_NAME,
+	REFERENCED_TABLE_NAME,
+	REFERENCED_COLUMN_NAME
+from
+	information_schema.KEY_COLUMN_USAGE
+where
+	TABLE_SCHEMA = database()
+	and REFERENCED_TABLE_NAME is not null
+order by
+	TABLE_NAME,
+	CONSTRAINT_NAME,
+	ORDINAL_POSITION;
+
+select * from sys.`schema_redundant_indexes`
+where table_schema = database()
+order by table_name, redundant_index_name, dominant_index_name;
@@ -0,0 +1,85 @@
+use npvrbe;
+
+create temporary table if not exists tmp_ahi_counts (
+	NAME varchar(193) not null,
+	STATUS varchar(193),
+	COUNT bigint,
+	PREV_COUNT bigint,
+	primary key (NAME)
+);
+
+set @ahi_sample = '
+insert into tmp_ahi_counts (NAME, STATUS, COUNT)
+select
+	NAME,
+	STATUS,
+	COUNT
+from
+	(
+	select
+		NAME,
+		STATUS,
+		COUNT
+	from
+		information_schema.INNODB_METRICS
+	where
+		SUBSYSTEM = ''adaptive_hash_index''
+) M
+on duplicate key update
+	PREV_COUNT = tmp_ahi_counts.COUNT,
+	STATUS = M.STATUS,
+	COUNT = M.COUNT';
+
+set @ahi_status = '
+select
+	''innodb_adaptive_hash_index'' as NAME,
+	@@global.innodb_adaptive_hash_index as COUNT,
+	null as DELTA,
+	null as STATUS
+union all
+select
+	''innodb_adaptive_hash_index_parts'',
+	@@global.innodb_adaptive_hash_index_parts,
+	null,
+	null
+union all
+select
+	''innodb_buffer_pool_size'',
+	@@global.innodb_buffer_pool_size,
+	null,
+	null
+union all
+select
+	NAME,
+	COUNT,
+	COUNT - coalesce(PREV_COUNT, 0),
+	STATUS
+from
+	tmp_ahi_counts';
+
+set @ahi_hit_rate = '
+select
+	round(100 * sum(if(NAME = ''adaptive_hash_searches'', COUNT - coalesce(PREV_COUNT, 0), 0))
+		/ nullif(sum(COUNT - coalesce(PREV_COUNT, 0)), 0), 2) as AHI_HIT_RATE_PCT
+from
+	tmp_ahi_counts
+where
+	NAME in (''adaptive_hash_searches'', ''adaptive_hash_searches_btree'')';
+
+prepare ahi_sample from @ahi_sample;
+prepare ahi_status from @ahi_status;
+prepare ahi_hit_rate from @ahi_hit_rate;
+
+-- each sample: run these three together; DELTA is the change since the
+-- previous ahi_sample in this session (the lifetime count on the first one)
+-- STATUS shows which counters are on: by default only adaptive_hash_searches
+-- and adaptive_hash_searches_btree are, and disabled ones stop counting;
+-- to enable the rest see Script-12.sql (admin only)
+execute ahi_sample;
+execute ahi_status;
+execute ahi_hit_rate;
+
+-- AHI memory ("node heap has N buffer(s)" in the INSERT BUFFER AND ADAPTIVE
+-- HASH INDEX section): expensive on a busy server and it changes slowly, so
+-- run this every 10th sample or so, not with every one
+show engine innodb status;
@@ -0,0 +1,7 @@
+-- admin only (SYSTEM_VARIABLES_ADMIN or SUPER): turns on the AHI counters
+-- read by Script-11.sql; only needed when the first query shows them disabled
+
+select NAME, STATUS from information_schema.INNODB_METRICS
+where SUBSYSTEM = 'adaptive_hash_index';
+
+set global innodb_monitor_enable = 'module_adaptive_hash';